@@ -118,6 +118,55 @@ def update_room(room_id):
         "room": room.to_dict()
     }), 200
 
+# ✅ API to Update Several Rooms at Once
+@app.route("/rooms/bulk", methods=["PUT"])
+def bulk_update_rooms():
+    data = request.get_json()
+
+    if not isinstance(data, dict) or not isinstance(data.get("rooms"), list):
+        return jsonify({
+            "error": "A list of rooms is required"
+        }), 400
+
+    room_updates = data["rooms"]
+    if not all(isinstance(room_data, dict) for room_data in room_updates):
+        return jsonify({
+            "error": "Every room must be an object"
+        }), 400
+    if any("room_id" not in room_data for room_data in room_updates):
+        return jsonify({
+            "error": "Every room must include a room_id"
+        }), 400
+
+    room_ids = [room_data["room_id"] for room_data in room_updates]
+    rooms = {room.RoomID: room for room in Room.query.filter(Room.RoomID.in_(room_ids)).all()}
+
+    missing_ids = [room_id for room_id in room_ids if room_id not in rooms]
+    if missing_ids:
+        return jsonify({
+            "error": "Room not found",
+            "missing_room_ids": missing_ids
+        }), 404
+
+    # Apply every update before a single commit so the batch is all-or-nothing
+    for room_data in room_updates:
+        room = rooms[room_data["room_id"]]
+        if "description" in room_data:
+            room.Description = room_data['description']
+        if "item_ids" in room_data:
+            room.ItemIDs = room_data['item_ids']
+        if "enemy_ids" in room_data:
+            room.EnemyIDs = room_data['enemy_ids']
+        if "door_locked" in room_data:
+            room.DoorLocked = room_data['door_locked']
+
+    db.session.commit()
+
+    return jsonify({
+        "message": "Rooms updated successfully",
+        "rooms": [rooms[room_id].to_dict() for room_id in room_ids]
+    }), 200
+
 # ✅ API to Delete Room
 @app.route("/room/<int:room_id>", methods=["DELETE"])
 def delete_room(room_id):
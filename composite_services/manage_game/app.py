@@ -1,14 +1,34 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+from flask.json.provider import DefaultJSONProvider
 import requests
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
+import json
 import logging
+import threading
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from cachetools import TTLCache
 from composite_services.utilities.activity_logger import log_activity
+from composite_services.utilities.circuit_breaker import CircuitBreaker, CircuitBreakerError
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that uses orjson for response serialization.
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Configure logging - debug output is only wanted in development
+logging.basicConfig(level=logging.DEBUG if os.getenv("FLASK_ENV") == "development" else logging.INFO)
 logger = logging.getLogger(__name__)
 
 # ✅ Microservice URLs
@@ -19,40 +39,282 @@ PLAYER_ROOM_INTERACTION_SERVICE_URL = os.getenv("PLAYER_ROOM_INTERACTION_SERVICE
 ENEMY_SERVICE_URL = os.getenv("ENEMY_SERVICE_URL", "http://enemy_service:5005")
 ACTIVITY_LOG_SERVICE_URL = os.getenv("ACTIVITY_LOG_SERVICE_URL", "http://activity_log_service:5013")
 
+# Default room state restored by the reset endpoints, as (room_id, payload)
+# pairs. Set ROOM_DEFAULTS_FILE to load them from a JSON list of room objects
+# instead, e.g. [{"room_id": 1, "item_ids": [1, 2], ...}, ...]
+def _load_room_defaults():
+    defaults_file = os.getenv("ROOM_DEFAULTS_FILE")
+    if not defaults_file:
+        return (
+            (1, {"item_ids": (1, 2), "enemy_ids": (), "door_locked": False}),
+            (2, {"item_ids": (3, 5), "enemy_ids": (1,), "door_locked": False}),
+            (3, {"item_ids": (4,), "enemy_ids": (2,), "door_locked": True}),
+        )
+
+    with open(defaults_file) as f:
+        rooms = json.load(f)
+    return tuple(
+        (room["room_id"], {key: value for key, value in room.items() if key != "room_id"})
+        for room in rooms
+    )
+
+ROOM_DEFAULTS = _load_room_defaults()
+
+# Pre-serialized body for the bulk room reset, since it never changes
+ROOM_RESET_BODY = orjson.dumps({"rooms": [{"room_id": room_id, **payload} for room_id, payload in ROOM_DEFAULTS]})
+
+# Request bodies are serialized with orjson and sent as raw data, which
+# skips requests' own stdlib json encoding
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Pooled HTTP session so downstream calls reuse connections instead of
+# opening a new one per request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    # raise_on_status=False hands the last response back so callers can keep
+    # checking status codes themselves. Read timeouts are never retried, so
+    # timeout=5 stays the real per-call bound the circuit breakers rely on
+    max_retries=Retry(total=2, read=0, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+# Keep connections alive and ask downstreams for compressed JSON responses;
+# requests sets Content-Length itself for the pre-serialized bodies
+SESSION.headers.update({
+    "Connection": "keep-alive",
+    "Accept-Encoding": "gzip",
+    "Accept": "application/json",
+})
+
+# One circuit breaker per downstream service. After 5 consecutive failures
+# (exceptions or 5xx responses) calls to that service fail fast with
+# CircuitBreakerError for 30 seconds instead of each one waiting out its
+# timeout. Calls through a breaker still run concurrently.
+def _is_server_error(response):
+    return response.status_code >= 500
+
+def _service_breaker(name):
+    return CircuitBreaker(fail_max=5, reset_timeout=30, name=name, is_failure=_is_server_error)
+
+PLAYER_BREAKER = _service_breaker("player_service")
+INVENTORY_BREAKER = _service_breaker("inventory_service")
+ROOM_BREAKER = _service_breaker("room_service")
+PLAYER_ROOM_INTERACTION_BREAKER = _service_breaker("player_room_interaction_service")
+ENEMY_BREAKER = _service_breaker("enemy_service")
+
+# Shared pool for fanning out independent downstream calls. Each full or
+# hard reset submits RESET_FAN_OUT tasks, and every gunicorn thread in this
+# worker may be running one, so size the pool for all of them at once
+RESET_FAN_OUT = 4
+RESET_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("GUNICORN_THREADS", "8")) * RESET_FAN_OUT)
+
+def json_response(payload, status=200):
+    """
+    Builds a JSON response straight from orjson bytes, skipping jsonify.
+    Accepts either a payload to serialize or already-serialized bytes.
+    """
+    body = payload if isinstance(payload, bytes) else orjson.dumps(payload)
+    return Response(body, status=status, mimetype="application/json")
+
+# Short-lived cache of player records, keyed by player_id. Writes made
+# through update_player refresh the entry with the player service's view of
+# the updated record, so /game/full-reset right after /game/reset is a hit.
+_player_cache = TTLCache(maxsize=1024, ttl=30)
+_player_cache_lock = threading.Lock()
+
+def get_player(player_id, fresh=False):
+    """
+    Fetches a player record, serving it from the cache when possible.
+    Pass fresh=True to skip the cache when the caller relies on fields other
+    services change (e.g. current health). Returns the parsed player data,
+    or None if the player service answered 404. Any other failure raises
+    (requests.HTTPError for an error status), so callers never mistake an
+    outage for a missing player.
+    """
+    if not fresh:
+        with _player_cache_lock:
+            player_data = _player_cache.get(player_id)
+        if player_data is not None:
+            return player_data
+
+    player_response = PLAYER_BREAKER.call(SESSION.get, f"{PLAYER_SERVICE_URL}/player/{player_id}", timeout=5)
+    if player_response.status_code == 404:
+        return None
+    player_response.raise_for_status()
+
+    player_data = orjson.loads(player_response.content)
+    with _player_cache_lock:
+        _player_cache[player_id] = player_data
+    return player_data
+
+def invalidate_player(player_id):
+    """
+    Drops a player's cached record after it has been modified.
+    """
+    with _player_cache_lock:
+        _player_cache.pop(player_id, None)
+
+def update_player(player_id, changes):
+    """
+    Sends a player PUT and keeps the cache in step with it. On success the
+    updated record returned by the player service replaces the cached one;
+    on any failure (including an exception) the entry is dropped.
+    Returns the PUT response.
+    """
+    updated_player = None
+    try:
+        player_response = PLAYER_BREAKER.call(
+            SESSION.put,
+            f"{PLAYER_SERVICE_URL}/player/{player_id}",
+            data=orjson.dumps(changes),
+            headers=JSON_HEADERS,
+            timeout=5
+        )
+        if player_response.status_code == 200:
+            updated_player = orjson.loads(player_response.content).get("player")
+        return player_response
+    finally:
+        with _player_cache_lock:
+            if updated_player:
+                _player_cache[player_id] = updated_player
+            else:
+                _player_cache.pop(player_id, None)
+
+# Recent serialized full-reset responses, keyed by (player_id, idempotency key),
+# so duplicate submissions to this worker don't re-run every downstream mutation
+_reset_response_cache = TTLCache(maxsize=4096, ttl=5)
+# Resets currently running, keyed like the cache. Duplicates that arrive
+# while one is in flight wait on its Future instead of starting their own
+_reset_in_flight = {}
+_reset_response_lock = threading.Lock()
+
 @app.route('/game/reset/<int:player_id>', methods=['POST'])
 def reset_character_progress(player_id):
     """
     Resets the player's game progress by updating their room and health.
     """
-    logger.debug(f"Resetting progress for player {player_id}")
+    logger.debug("Resetting progress for player %s", player_id)
     
-    player_response = requests.get(f"{PLAYER_SERVICE_URL}/player/{player_id}")
-    if player_response.status_code != 200:
+    # Get player data to determine max health. Bypass the cache - the
+    # no-op check below depends on health and room, which change in combat
+    try:
+        player_data = get_player(player_id, fresh=True)
+    except (CircuitBreakerError, requests.RequestException) as e:
+        logger.error("Player service unavailable for reset of player %s: %s", player_id, e)
+        return jsonify({"error": f"Player service unavailable: {str(e)}"}), 503
+    if player_data is None:
         return jsonify({"error": "Player not found"}), 404
 
-    # Get player data to determine max health
-    player_data = player_response.json()
     max_health = player_data.get("max_health", player_data.get("MaxHealth", 100))
+
+    # ✅ Skip every downstream write if the player is already at the defaults
+    already_reset = (
+        player_data.get("room_id") == 0
+        and player_data.get("current_health") == max_health
+        and player_data.get("sum_score", 0) == 0
+    )
+    if already_reset:
+        logger.debug("Player %s is already reset, skipping", player_id)
+        return json_response({"message": f"Progress already reset for player {player_id}.", "no_op": True})
     
     # ✅ Reset player progress - restore full health and set room to 0
-    requests.put(f"{PLAYER_SERVICE_URL}/player/{player_id}", 
-                 json={"current_health": max_health, "room_id": 0, "sum_score":0})
+    try:
+        update_player(player_id, {"current_health": max_health, "room_id": 0, "sum_score":0})
+    except (CircuitBreakerError, requests.RequestException) as e:
+        logger.error("Error resetting player %s: %s", player_id, e)
+        return jsonify({"error": f"Player reset error: {str(e)}"}), 503
 
-    # ✅ Reset all enemies
-    requests.get(f"{ENEMY_SERVICE_URL}/reset")
+    # ✅ Reset all enemies. The player has already been reset at this point,
+    # so a failure here is reported as a partial reset
+    errors = []
+    try:
+        ENEMY_BREAKER.call(SESSION.get, f"{ENEMY_SERVICE_URL}/reset", timeout=5)
+    except (CircuitBreakerError, requests.RequestException) as e:
+        logger.error("Error resetting enemies: %s", e)
+        errors.append(f"Enemy reset error: {str(e)}")
 
-    # ✅ Log reset via shared utility
+    # ✅ Log reset via shared utility (in the background)
     log_activity(player_id, "Game progress reset")
 
-    return jsonify({"message": f"Progress reset for player {player_id}."})
+    if errors:
+        return json_response({
+            "message": f"Progress partially reset for player {player_id} - some errors occurred.",
+            "errors": errors
+        }, 207)
+    return json_response({"message": f"Progress reset for player {player_id}."})
 
-@app.route('/game/full-reset/<int:player_id>', methods=['POST'])
-def full_game_reset(player_id):
+def _reset_player_stats(player_id, max_health):
+    """
+    Restores the player's stats and location. Returns an error message on failure.
+    """
+    player_reset = update_player(
+        player_id,
+        {"current_health": max_health, "max_health": max_health, "damage": 10, "room_id": 0,"sum_score": 0}
+    )
+    if player_reset.status_code != 200:
+        logger.error("Failed to reset player: %s", player_reset.status_code)
+        return f"Player reset failed: {player_reset.text}"
+    logger.debug("Successfully reset player stats")
+    return None
+
+def _clear_inventory(player_id):
+    """
+    Clears the player's inventory. Returns an error message on failure.
+    """
+    inventory_reset = INVENTORY_BREAKER.call(
+        SESSION.delete,
+        f"{INVENTORY_SERVICE_URL}/inventory/player/{player_id}",
+        timeout=5
+    )
+    if inventory_reset.status_code not in [200, 404]:  # 404 is acceptable if no inventory
+        logger.error("Failed to clear inventory: %s", inventory_reset.status_code)
+        return f"Inventory reset failed: {inventory_reset.text}"
+    logger.debug("Successfully cleared player inventory")
+    return None
+
+def _reset_player_interactions(player_id):
+    """
+    Clears the player's room interaction history. Returns an error message on failure.
+    """
+    logger.debug("Clearing player interaction history for player %s", player_id)
+    player_interaction_reset = PLAYER_ROOM_INTERACTION_BREAKER.call(
+        SESSION.post,
+        f"{PLAYER_ROOM_INTERACTION_SERVICE_URL}/player/{player_id}/reset",
+        timeout=5
+    )
+    if player_interaction_reset.status_code != 200:
+        logger.error("Failed to clear player interaction history: %s", player_interaction_reset.status_code)
+        return f"Player interaction reset failed: {player_interaction_reset.text}"
+    logger.debug("Successfully cleared player interaction history")
+    return None
+
+def _reset_rooms():
+    """
+    Restores the rooms' default items and enemies in a single bulk update.
+    Returns an error message on failure.
+    """
+    room_reset = ROOM_BREAKER.call(
+        SESSION.put,
+        f"{ROOM_SERVICE_URL}/rooms/bulk",
+        data=ROOM_RESET_BODY,
+        headers=JSON_HEADERS,
+        timeout=5
+    )
+    if room_reset.status_code != 200:
+        logger.error("Failed to reset rooms: %s", room_reset.status_code)
+        return f"Room reset failed: {room_reset.text}"
+    logger.debug("Successfully reset game rooms")
+    return None
+
+def _perform_full_game_reset(player_id):
     """
     Performs a complete game reset across all services for the specified player.
     This resets the player state, inventory, and restores rooms to their original state.
+    Returns a (response body, status code) pair.
     """
-    logger.info(f"Performing full game reset for player {player_id}")
+    logger.info("Performing full game reset for player %s", player_id)
     reset_results = {
         "player": False,
         "inventory": False,
@@ -62,103 +324,45 @@ def full_game_reset(player_id):
     
     try:
         # Step 1: Verify player exists
-        player_response = requests.get(f"{PLAYER_SERVICE_URL}/player/{player_id}")
-        if player_response.status_code != 200:
-            return jsonify({"error": "Player not found"}), 404
+        try:
+            player_data = get_player(player_id)
+        except (CircuitBreakerError, requests.RequestException) as e:
+            logger.error("Player service unavailable for full reset of player %s: %s", player_id, e)
+            return {"error": f"Player service unavailable: {str(e)}", "reset_details": reset_results}, 503
+        if player_data is None:
+            return {"error": "Player not found"}, 404
             
-        player_data = player_response.json()
         player_name = player_data.get("name", f"Player {player_id}")
-        logger.debug(f"Found player: {player_name}")
+        logger.debug("Found player: %s", player_name)
         
         # Get max health value
         max_health = player_data.get("max_health", player_data.get("MaxHealth", 100))
         
-        # Step 2: Reset player stats and location
-        try:
-            player_reset = requests.put(
-                f"{PLAYER_SERVICE_URL}/player/{player_id}", 
-                json={"current_health": max_health, "max_health": max_health, "damage": 10, "room_id": 0,"sum_score": 0},
-                timeout=5
-            )
-            if player_reset.status_code == 200:
-                reset_results["player"] = True
-                logger.debug("Successfully reset player stats")
-            else:
-                logger.error(f"Failed to reset player: {player_reset.status_code}")
-                reset_results["errors"].append(f"Player reset failed: {player_reset.text}")
-        except Exception as e:
-            logger.error(f"Error resetting player: {str(e)}")
-            reset_results["errors"].append(f"Player reset error: {str(e)}")
-        
-        # Step 3: Clear player's inventory
-        try:
-            inventory_reset = requests.delete(
-                f"{INVENTORY_SERVICE_URL}/inventory/player/{player_id}",
-                timeout=5
-            )
-            if inventory_reset.status_code in [200, 404]:  # 404 is acceptable if no inventory
-                reset_results["inventory"] = True
-                logger.debug("Successfully cleared player inventory")
-            else:
-                logger.error(f"Failed to clear inventory: {inventory_reset.status_code}")
-                reset_results["errors"].append(f"Inventory reset failed: {inventory_reset.text}")
-        except Exception as e:
-            logger.error(f"Error clearing inventory: {str(e)}")
-            reset_results["errors"].append(f"Inventory reset error: {str(e)}")
-            
-        # Step 3.5: Reset player room interaction history
-        try:
-            logger.debug(f"Clearing player interaction history for player {player_id}")
-            player_interaction_reset = requests.post(
-                f"{PLAYER_ROOM_INTERACTION_SERVICE_URL}/player/{player_id}/reset",
-                timeout=5
-            )
-            
-            if player_interaction_reset.status_code == 200:
-                logger.debug("Successfully cleared player interaction history")
-            else:
-                logger.error(f"Failed to clear player interaction history: {player_interaction_reset.status_code}")
-                reset_results["errors"].append(f"Player interaction reset failed: {player_interaction_reset.text}")
-        except Exception as e:
-            logger.error(f"Error clearing player interaction history: {str(e)}")
-            reset_results["errors"].append(f"Player interaction reset error: {str(e)}")
-        
-        # Step 4: Reset rooms - restore default items and enemies
-        # This is a simplified approach - a more robust solution would
-        # load default room data from a configuration or database
-        try:
-            # For simplicity, we'll update just the first few rooms with default settings
-            room_defaults = [
-                {"room_id": 1, "item_ids": [1, 2], "enemy_ids": [], "door_locked": False},
-                {"room_id": 2, "item_ids": [3,5], "enemy_ids": [1], "door_locked": False},
-                {"room_id": 3, "item_ids": [4], "enemy_ids": [2], "door_locked": True}
-            ]
-            
-            room_update_success = True
-            for room_data in room_defaults:
-                room_id = room_data.pop("room_id")  # Extract room_id from the data
-                try:
-                    room_reset = requests.put(
-                        f"{ROOM_SERVICE_URL}/room/{room_id}",
-                        json=room_data,
-                        timeout=5
-                    )
-                    if room_reset.status_code != 200:
-                        room_update_success = False
-                        logger.error(f"Failed to reset room {room_id}: {room_reset.status_code}")
-                        reset_results["errors"].append(f"Room {room_id} reset failed: {room_reset.text}")
-                except Exception as e:
-                    room_update_success = False
-                    logger.error(f"Error resetting room {room_id}: {str(e)}")
-                    reset_results["errors"].append(f"Room {room_id} reset error: {str(e)}")
-            
-            reset_results["rooms"] = room_update_success
-            if room_update_success:
-                logger.debug("Successfully reset game rooms")
-        except Exception as e:
-            logger.error(f"Error in room reset process: {str(e)}")
-            reset_results["errors"].append(f"Room reset process error: {str(e)}")
-        
+        # Steps 2-4: Reset player stats, inventory, interaction history and rooms.
+        # These hit independent services, so fan them out concurrently.
+        futures = {
+            RESET_EXECUTOR.submit(_reset_player_stats, player_id, max_health): ("player", "Player reset"),
+            RESET_EXECUTOR.submit(_clear_inventory, player_id): ("inventory", "Inventory reset"),
+            RESET_EXECUTOR.submit(_reset_player_interactions, player_id): (None, "Player interaction reset"),
+            RESET_EXECUTOR.submit(_reset_rooms): ("rooms", "Room reset"),
+        }
+
+        for future in as_completed(futures):
+            result_key, label = futures[future]
+            try:
+                error = future.result()
+            except CircuitBreakerError as e:
+                logger.error("Skipped %s, circuit open: %s", label.lower(), e)
+                error = f"{label} skipped: service unavailable (circuit open)"
+            except Exception as e:
+                logger.error("Error during %s: %s", label.lower(), e)
+                error = f"{label} error: {str(e)}"
+
+            if error:
+                reset_results["errors"].append(error)
+            elif result_key:
+                reset_results[result_key] = True
+
         # Log the full reset via shared utility
         log_activity(player_id, f"Full game reset performed for {player_name}")
         
@@ -170,26 +374,86 @@ def full_game_reset(player_id):
         ])
         
         if overall_success:
-            logger.info(f"Full game reset successful for player {player_id}")
-            return jsonify({
+            logger.info("Full game reset successful for player %s", player_id)
+            return {
                 "message": f"Game fully reset for {player_name}",
                 "player_id": player_id,
                 "reset_details": reset_results
-            })
+            }, 200
         else:
-            logger.warning(f"Partial game reset for player {player_id} - some services failed")
-            return jsonify({
+            logger.warning("Partial game reset for player %s - some services failed", player_id)
+            return {
                 "message": f"Game partially reset for {player_name} - some errors occurred",
                 "player_id": player_id,
                 "reset_details": reset_results
-            }), 207  # 207 Multi-Status
+            }, 207  # 207 Multi-Status
             
     except Exception as e:
-        logger.error(f"Unhandled exception during game reset: {str(e)}")
-        return jsonify({
+        logger.error("Unhandled exception during game reset: %s", e)
+        return {
             "error": f"Failed to reset game: {str(e)}",
             "reset_details": reset_results
-        }), 500
+        }, 500
+
+@app.route('/game/full-reset/<int:player_id>', methods=['POST'])
+def full_game_reset(player_id):
+    """
+    Performs a complete game reset for the specified player. A repeat of a
+    successful (or player-not-found) request within a few seconds is answered
+    from the idempotency cache instead of re-running every downstream reset.
+    Clients may send an Idempotency-Key header to control the cache key.
+
+    Duplicates that arrive while the first request is still running wait for
+    its result and share it (single-flight), whatever its status.
+
+    The cache lives in each gunicorn worker process, so a duplicate that is
+    routed to a different worker still performs the reset. This is a
+    best-effort guard against double submits, not a guarantee.
+    """
+    idempotency_key = request.headers.get("Idempotency-Key")
+    cache_key = (player_id, idempotency_key or "full-reset")
+
+    with _reset_response_lock:
+        cached = _reset_response_cache.get(cache_key)
+        in_flight = None
+        if cached is None:
+            in_flight = _reset_in_flight.get(cache_key)
+            leader = in_flight is None
+            if leader:
+                in_flight = Future()
+                _reset_in_flight[cache_key] = in_flight
+
+    if cached is None and not leader:
+        logger.debug("Waiting for in-flight full reset of player %s", player_id)
+        cached = in_flight.result()
+    if cached is not None:
+        logger.debug("Serving cached full reset response for player %s", player_id)
+        body, status = cached
+        response = json_response(body, status)
+        response.headers["X-Cache"] = "HIT"
+        return response
+
+    try:
+        payload, status = _perform_full_game_reset(player_id)
+        # Serialize once; cache hits reuse the same bytes
+        body = orjson.dumps(payload)
+    except BaseException as e:
+        with _reset_response_lock:
+            _reset_in_flight.pop(cache_key, None)
+        in_flight.set_exception(e)
+        raise
+
+    with _reset_response_lock:
+        # Only keep final answers. A partial reset (207) or server error must
+        # let a retry re-run the steps that failed
+        if status in (200, 404):
+            _reset_response_cache[cache_key] = (body, status)
+        _reset_in_flight.pop(cache_key, None)
+    in_flight.set_result((body, status))
+
+    response = json_response(body, status)
+    response.headers["X-Cache"] = "MISS"
+    return response
 
 @app.route('/game/end/<int:player_id>', methods=['POST'])
 def end_game(player_id):
@@ -197,11 +461,11 @@ def end_game(player_id):
     Handle end-of-game logic including awarding completion bonus,
     updating player score, and generating appropriate response.
     """
-    logger.info(f"Processing end of game for player {player_id}")
+    logger.info("Processing end of game for player %s", player_id)
     
     try:
         # Get current player data
-        player_response = requests.get(f"{PLAYER_SERVICE_URL}/player/{player_id}")
+        player_response = PLAYER_BREAKER.call(SESSION.get, f"{PLAYER_SERVICE_URL}/player/{player_id}", timeout=5)
         if player_response.status_code != 200:
             return jsonify({"error": "Player not found"}), 404
             
@@ -213,7 +477,11 @@ def end_game(player_id):
         try:
             update_score_url = f"{PLAYER_SERVICE_URL}/player/{player_id}/score"
             score_payload = {"points": completion_bonus}
-            score_response = requests.patch(update_score_url, json=score_payload, timeout=5)
+            try:
+                score_response = PLAYER_BREAKER.call(SESSION.patch, update_score_url, data=orjson.dumps(score_payload),
+                                                   headers=JSON_HEADERS, timeout=5)
+            finally:
+                invalidate_player(player_id)
             
             if score_response.status_code == 200:
                 new_score = score_response.json().get("new_sum_score", current_score + completion_bonus)
@@ -221,12 +489,12 @@ def end_game(player_id):
                 
                 # Log this achievement using the shared utility
                 log_activity(player_id, f"Completed the game! (+{completion_bonus} score)")
-                logger.info(f"Player {player_id} completed the game with final score {new_score}")
+                logger.info("Player %s completed the game with final score %s", player_id, new_score)
             else:
-                logger.warning(f"Failed to award completion bonus: {score_response.status_code}")
+                logger.warning("Failed to award completion bonus: %s", score_response.status_code)
                 score_message = f"FINAL SCORE: {current_score}"
         except Exception as e:
-            logger.error(f"Error updating score for game completion: {str(e)}")
+            logger.error("Error updating score for game completion: %s", e)
             score_message = f"FINAL SCORE: {current_score}"
         
         return jsonify({
@@ -237,7 +505,7 @@ def end_game(player_id):
             "score_message": score_message
         })
     except Exception as e:
-        logger.error(f"Error creating end of game response: {str(e)}")
+        logger.error("Error creating end of game response: %s", e)
         return jsonify({
             "message": "Congratulations! You've completed the dungeon!",
             "description": "The game is over, but there was an error retrieving your final stats.",
@@ -246,12 +514,26 @@ def end_game(player_id):
             "score_message": "FINAL SCORE: 0"
         }), 500
 
+def _hard_reset_player(player_id):
+    """
+    Looks up the player's max health and restores their stats and location.
+    Returns an error message on failure.
+    """
+    # Read straight from the player service - a hard reset shouldn't trust the cache
+    player_response = PLAYER_BREAKER.call(SESSION.get, f"{PLAYER_SERVICE_URL}/player/{player_id}", timeout=5)
+    if player_response.status_code != 200:
+        return f"Player lookup failed: {player_response.status_code}"
+
+    player_data = orjson.loads(player_response.content)
+    max_health = player_data.get("max_health", player_data.get("MaxHealth", 100))
+    return _reset_player_stats(player_id, max_health)
+
 @app.route('/game/hard-reset/<int:player_id>', methods=['POST'])
 def hard_reset(player_id):
     """
     Performs a complete hard reset of the player's game state.
     """
-    logger.info(f"Performing HARD RESET for player {player_id}")
+    logger.info("Performing HARD RESET for player %s", player_id)
     
     reset_results = {
         "player_reset": False,
@@ -261,83 +543,26 @@ def hard_reset(player_id):
     }
     
     try:
-        # 1. Reset player stats and location
-        try:
-            # Get player data to find max health
-            player_response = requests.get(f"{PLAYER_SERVICE_URL}/player/{player_id}")
-            if player_response.status_code == 200:
-                player_data = player_response.json()
-                max_health = player_data.get("max_health", player_data.get("MaxHealth", 100))
-                
-                # Reset player to initial state
-                player_reset = requests.put(
-                    f"{PLAYER_SERVICE_URL}/player/{player_id}", 
-                    json={
-                        "current_health": max_health,
-                        "max_health": max_health,
-                        "damage": 10,
-                        "room_id": 0,
-                        "sum_score": 0  # Reset score to 0
-                    },
-                    timeout=5
-                )
-                
-                if player_reset.status_code == 200:
-                    reset_results["player_reset"] = True
-                    logger.info(f"Successfully reset player {player_id} stats and location")
-        except Exception as e:
-            logger.error(f"Error resetting player stats: {str(e)}")
-            
-        # 2. Clear player's inventory
-        try:
-            inventory_reset = requests.delete(
-                f"{INVENTORY_SERVICE_URL}/inventory/player/{player_id}",
-                timeout=5
-            )
-            if inventory_reset.status_code in [200, 404]:
-                reset_results["inventory_reset"] = True
-                logger.info(f"Successfully cleared inventory for player {player_id}")
-        except Exception as e:
-            logger.error(f"Error clearing inventory: {str(e)}")
-            
-        # 3. Reset player-room interactions
-        try:
-            interaction_reset = requests.post(
-                f"{PLAYER_ROOM_INTERACTION_SERVICE_URL}/player/{player_id}/reset",
-                timeout=5
-            )
-            if interaction_reset.status_code == 200:
-                reset_results["interactions_reset"] = True
-                logger.info(f"Successfully reset player-room interactions for player {player_id}")
-        except Exception as e:
-            logger.error(f"Error resetting player-room interactions: {str(e)}")
-            
-        # 4. Reset room states
-        try:
-            # Reset rooms to their default state
-            room_defaults = [
-                {"room_id": 1, "item_ids": [1, 2], "enemy_ids": [], "door_locked": False},
-                {"room_id": 2, "item_ids": [3, 5], "enemy_ids": [1], "door_locked": False},
-                {"room_id": 3, "item_ids": [4], "enemy_ids": [2], "door_locked": True}
-            ]
-            
-            room_reset_success = True
-            for room_data in room_defaults:
-                room_id = room_data.pop("room_id")  # Extract room_id from the data
-                room_reset = requests.put(
-                    f"{ROOM_SERVICE_URL}/room/{room_id}",
-                    json=room_data,
-                    timeout=5
-                )
-                if room_reset.status_code != 200:
-                    room_reset_success = False
-                    logger.error(f"Failed to reset room {room_id}")
-                    
-            if room_reset_success:
-                reset_results["room_reset"] = True
-                logger.info("Successfully reset all rooms to default state")
-        except Exception as e:
-            logger.error(f"Error resetting rooms: {str(e)}")
+        # Every step targets an independent service, so run them all
+        # concurrently: player stats, inventory, interactions and rooms
+        futures = {
+            RESET_EXECUTOR.submit(_hard_reset_player, player_id): "player_reset",
+            RESET_EXECUTOR.submit(_clear_inventory, player_id): "inventory_reset",
+            RESET_EXECUTOR.submit(_reset_player_interactions, player_id): "interactions_reset",
+            RESET_EXECUTOR.submit(_reset_rooms): "room_reset",
+        }
+
+        for future in as_completed(futures):
+            result_key = futures[future]
+            try:
+                error = future.result()
+            except Exception as e:
+                error = str(e)
+
+            if error:
+                logger.error("Hard reset step %s failed for player %s: %s", result_key, player_id, error)
+            else:
+                reset_results[result_key] = True
             
         # Send a hard reset log event via shared utility
         log_activity(player_id, "HARD RESET performed on game")
@@ -359,12 +584,14 @@ def hard_reset(player_id):
             })
             
     except Exception as e:
-        logger.error(f"Unhandled exception during hard reset: {str(e)}")
+        logger.error("Unhandled exception during hard reset: %s", e)
         return jsonify({
             "success": False,
             "message": f"Hard reset failed: {str(e)}",
             "details": reset_results
         }), 500
 
+# Production runs under gunicorn (see gunicorn.conf.py); the dev server is
+# only for local development
 if __name__ == '__main__':
-    app.run(host="0.0.0.0", port=5014, debug=True)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=5014, debug=os.getenv("FLASK_ENV") == "development")
\ No newline at end of file
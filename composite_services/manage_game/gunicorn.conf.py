@@ -0,0 +1,10 @@
+# composite_services/manage_game/gunicorn.conf.py
+import multiprocessing
+import os
+
+# The service mostly waits on other microservices, so threaded workers give
+# it real concurrency without the cost of one process per request
+bind = "0.0.0.0:5014"
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
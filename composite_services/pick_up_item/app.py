@@ -208,7 +208,8 @@ def activity_log():
     if not player_id or not action:
         return jsonify({"error": "player_id and action are required"}), 400
     
-    success = log_activity(player_id, action)
+    # Wait for RabbitMQ so the response reflects whether the log was stored
+    success = log_activity(player_id, action, wait=True)
     if success:
         return jsonify({"message": "Activity logged successfully"}), 200
     else:
@@ -3,64 +3,216 @@ import pika
 import logging
 import os
 from datetime import datetime
-import json
+import orjson
+import queue
+import threading
+import time
+import atexit
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
+# Logging is configured by the service that imports this module
 logger = logging.getLogger(__name__)
 
 # RabbitMQ configuration
 RABBITMQ_HOST = os.getenv("RABBITMQ_HOST", "rabbitmq")
 ACTIVITY_LOG_QUEUE = "activity_log_queue"
 
-def log_activity(player_id, action):
+# Messages are buffered in memory and published in batches by a single
+# background thread, which owns the only channel. A batch is sent once it
+# reaches BATCH_MAX_SIZE messages or BATCH_WINDOW seconds after its first one.
+BUFFER_MAX_SIZE = 10_000
+BATCH_MAX_SIZE = 100
+BATCH_WINDOW = 0.01
+
+_buffer = queue.Queue(maxsize=BUFFER_MAX_SIZE)
+_publisher_thread = None
+_publisher_lock = threading.Lock()
+_STOP = object()
+
+# Every message uses the same properties, so build them once
+_PERSISTENT = pika.BasicProperties(
+    delivery_mode=2  # Make message persistent
+)
+
+def _open_channel():
+    """
+    Opens a new connection and channel, declaring the activity log queue once.
+    """
+    connection = pika.BlockingConnection(pika.ConnectionParameters(host=RABBITMQ_HOST))
+    channel = connection.channel()
+
+    # Ensure the queue exists and is durable. This runs once per channel
+    # lifetime, never per message
+    channel.queue_declare(queue=ACTIVITY_LOG_QUEUE, durable=True)
+    return channel
+
+def _discard_channel(channel):
+    """
+    Closes a channel's connection, ignoring errors if it is already gone.
+    """
+    try:
+        channel.connection.close()
+    except Exception:
+        pass
+
+def _next_batch():
+    """
+    Blocks for the next message, then gathers more until the batch is full
+    or the aggregation window closes. Returns (messages, stop_requested).
+    """
+    first = _buffer.get()
+    if first is _STOP:
+        return [], True
+
+    batch = [first]
+    deadline = time.monotonic() + BATCH_WINDOW
+    while len(batch) < BATCH_MAX_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            message = _buffer.get(timeout=remaining)
+        except queue.Empty:
+            break
+        if message is _STOP:
+            return batch, True
+        batch.append(message)
+    return batch, False
+
+def _publish_batch(channel, batch):
+    """
+    Publishes a batch of encoded messages back to back on one channel.
+    Returns (channel, sent): the channel to use next time, which is None if
+    it was lost, and how many messages were published.
+    """
+    sent = 0
+
+    # The channel may have been closed by the broker while idle, so retry
+    # once on a fresh connection before giving up. The retry resumes at the
+    # first unsent message so nothing already published is sent twice.
+    for _ in range(2):
+        try:
+            if channel is None or not channel.is_open:
+                channel = _open_channel()
+            while sent < len(batch):
+                channel.basic_publish(
+                    exchange='',
+                    routing_key=ACTIVITY_LOG_QUEUE,
+                    body=batch[sent],
+                    properties=_PERSISTENT
+                )
+                sent += 1
+            logger.debug("Published %s activity log(s) via RabbitMQ", len(batch))
+            return channel, sent
+        except (pika.exceptions.ConnectionClosed, pika.exceptions.ChannelClosed,
+                pika.exceptions.StreamLostError, pika.exceptions.ChannelWrongStateError,
+                pika.exceptions.ConnectionWrongStateError) as e:
+            if channel is not None:
+                _discard_channel(channel)
+            channel = None
+            logger.warning("RabbitMQ channel closed, reconnecting: %s", e)
+        except pika.exceptions.AMQPConnectionError as e:
+            logger.error("Failed to connect to RabbitMQ: %s", e)
+            break
+        except Exception as e:
+            logger.error("Unexpected error logging activity to RabbitMQ: %s", e)
+            if channel is not None:
+                _discard_channel(channel)
+            channel = None
+            break
+
+    logger.error("Dropped %s activity log(s) that could not be published to RabbitMQ", len(batch) - sent)
+    return channel, sent
+
+def _run_publisher():
     """
-    Logs player activity by sending a message directly to RabbitMQ.
+    Background loop that drains the buffer into RabbitMQ until stopped.
+    """
+    channel = None
+    stop = False
+    while not stop:
+        batch, stop = _next_batch()
+        if batch:
+            channel, _ = _publish_batch(channel, batch)
+    if channel is not None:
+        _discard_channel(channel)
+
+def _ensure_publisher():
+    """
+    Starts the publisher thread on first use. Starting lazily keeps it out of
+    the parent process when the service is run under a forking server.
+    """
+    global _publisher_thread
+    if _publisher_thread is not None and _publisher_thread.is_alive():
+        return
+    with _publisher_lock:
+        if _publisher_thread is None or not _publisher_thread.is_alive():
+            _publisher_thread = threading.Thread(target=_run_publisher, name="activity-log-publisher", daemon=True)
+            _publisher_thread.start()
+
+def _flush_on_exit():
+    """
+    Gives the publisher a moment to send whatever is still buffered.
+    """
+    if _publisher_thread is None or not _publisher_thread.is_alive():
+        return
+    try:
+        _buffer.put(_STOP, timeout=1)
+    except queue.Full:
+        return
+    _publisher_thread.join(timeout=2)
+
+atexit.register(_flush_on_exit)
+
+def log_activity(player_id, action, wait=False):
+    """
+    Logs player activity by sending a message to RabbitMQ.
+    
+    By default the message is queued and published in the background, so
+    this never waits on the broker. Callers that report the outcome to a
+    client should pass wait=True to publish before returning.
     
     Args:
         player_id (int): ID of the player performing the action
         action (str): Description of the action performed
+        wait (bool): Publish synchronously instead of queueing
         
     Returns:
-        bool: True if logging was successful, False otherwise
+        bool: With wait=True, True if the message was published. Otherwise
+        True if it was queued - a queued message can still be dropped later
+        if RabbitMQ is unreachable.
     """
     if not player_id or not action:
         logger.error("Missing required parameters: player_id and action must be provided")
         return False
         
     try:
-        # Connect to RabbitMQ
-        connection = pika.BlockingConnection(pika.ConnectionParameters(host=RABBITMQ_HOST))
-        channel = connection.channel()
-        
-        # Ensure the queue exists and is durable
-        channel.queue_declare(queue=ACTIVITY_LOG_QUEUE, durable=True)
-        
         # Create the message payload
         message = {
             "player_id": player_id,
             "action": action,
             "timestamp": datetime.utcnow().isoformat()
         }
-        
-        # Publish the message to the queue
-        channel.basic_publish(
-            exchange='',
-            routing_key=ACTIVITY_LOG_QUEUE,
-            body=json.dumps(message),
-            properties=pika.BasicProperties(
-                delivery_mode=2  # Make message persistent
-            )
-        )
-        
-        # Close the connection
-        connection.close()
-        logger.debug(f"Activity logged successfully via RabbitMQ: Player {player_id} - {action}")
+
+        body = orjson.dumps(message)
+
+        if wait:
+            # Use a short-lived channel of our own; the long-lived one belongs to
+            # the publisher thread
+            channel, sent = _publish_batch(None, [body])
+            if channel is not None:
+                _discard_channel(channel)
+            if sent:
+                logger.debug("Activity logged successfully via RabbitMQ: Player %s - %s", player_id, action)
+            return sent == 1
+
+        _ensure_publisher()
+        _buffer.put_nowait(body)
+        logger.debug("Activity queued for RabbitMQ: Player %s - %s", player_id, action)
         return True
         
-    except pika.exceptions.AMQPConnectionError as e:
-        logger.error(f"Failed to connect to RabbitMQ: {str(e)}")
+    except queue.Full:
+        logger.error("Activity log buffer is full, dropping: Player %s - %s", player_id, action)
         return False
     except Exception as e:
-        logger.error(f"Unexpected error logging activity to RabbitMQ: {str(e)}")
-        return False
\ No newline at end of file
+        logger.error("Unexpected error logging activity to RabbitMQ: %s", e)
+        return False
@@ -0,0 +1,96 @@
+# composite_services/utilities/circuit_breaker.py
+import threading
+import time
+
+
+class CircuitBreakerError(Exception):
+    """
+    Raised when a call is rejected because the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Fails calls to a downstream service fast once it has failed repeatedly.
+
+    After fail_max consecutive failures the circuit opens and calls raise
+    CircuitBreakerError without running. Once reset_timeout seconds have
+    passed, a single trial call is let through: success closes the circuit,
+    failure opens it again.
+
+    The lock only guards the breaker's own state. The wrapped call runs
+    outside it, so concurrent calls through one breaker still overlap.
+
+    Args:
+        fail_max (int): Consecutive failures before the circuit opens
+        reset_timeout (float): Seconds to stay open before a trial call
+        name (str): Name used in error messages
+        is_failure (callable): Optional check on a call's return value, for
+            failures that don't raise (e.g. HTTP 5xx responses)
+    """
+
+    def __init__(self, fail_max=5, reset_timeout=30, name=None, is_failure=None):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.name = name
+        self.is_failure = is_failure
+
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def _current_state(self):
+        # Caller must hold self._lock
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    @property
+    def state(self):
+        with self._lock:
+            return self._current_state()
+
+    def _before_call(self):
+        """
+        Rejects the call if the circuit is open. Returns True if this call is
+        the half-open trial.
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == "open" or (state == "half-open" and self._trial_in_flight):
+                raise CircuitBreakerError(f"Circuit '{self.name}' is open")
+            if state == "half-open":
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def _after_call(self, success, trial):
+        with self._lock:
+            if trial:
+                self._trial_in_flight = False
+            if success:
+                self._failures = 0
+                self._opened_at = None
+                return
+
+            self._failures += 1
+            if trial or self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+    def call(self, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs) through the breaker and returns its result.
+        """
+        trial = self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException:
+            self._after_call(False, trial)
+            raise
+
+        failed = self.is_failure is not None and self.is_failure(result)
+        self._after_call(not failed, trial)
+        return result
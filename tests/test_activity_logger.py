@@ -0,0 +1,49 @@
+import pika
+
+from composite_services.utilities import activity_logger
+
+
+class FakeChannel:
+    def __init__(self, published, fail_after=None):
+        self.published = published
+        self.fail_after = fail_after
+        self.is_open = True
+        self.connection = self
+
+    def basic_publish(self, exchange, routing_key, body, properties):
+        if self.fail_after is not None and len(self.published) >= self.fail_after:
+            self.is_open = False
+            raise pika.exceptions.StreamLostError("connection lost")
+        self.published.append(body)
+
+    def close(self):
+        self.is_open = False
+
+
+def test_publish_batch_resumes_after_lost_channel(monkeypatch):
+    published = []
+    monkeypatch.setattr(activity_logger, "_open_channel", lambda: FakeChannel(published))
+    batch = [b"1", b"2", b"3", b"4"]
+
+    channel, sent = activity_logger._publish_batch(FakeChannel(published, fail_after=2), batch)
+
+    assert sent == 4
+    assert channel.is_open
+    # Messages sent before the failure are not published a second time
+    assert published == batch
+
+
+def test_log_activity_wait_reports_broker_failure(monkeypatch):
+    def unreachable():
+        raise pika.exceptions.AMQPConnectionError("broker down")
+    monkeypatch.setattr(activity_logger, "_open_channel", unreachable)
+
+    assert activity_logger.log_activity(1, "Picked up Sword", wait=True) is False
+
+
+def test_log_activity_wait_publishes_before_returning(monkeypatch):
+    published = []
+    monkeypatch.setattr(activity_logger, "_open_channel", lambda: FakeChannel(published))
+
+    assert activity_logger.log_activity(1, "Picked up Sword", wait=True) is True
+    assert len(published) == 1
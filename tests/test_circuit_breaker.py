@@ -0,0 +1,80 @@
+import threading
+import time
+
+import pytest
+
+from composite_services.utilities.circuit_breaker import CircuitBreaker, CircuitBreakerError
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def fail():
+    raise ConnectionError("service down")
+
+
+def test_concurrent_calls_overlap():
+    breaker = CircuitBreaker(fail_max=5, reset_timeout=30, name="test")
+    threads = [threading.Thread(target=breaker.call, args=(time.sleep, 0.2)) for _ in range(8)]
+
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    # Serialized calls would take 8 * 0.2s
+    assert elapsed < 0.6
+
+
+def test_opens_after_consecutive_exceptions():
+    breaker = CircuitBreaker(fail_max=3, reset_timeout=30, name="test")
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError):
+            breaker.call(fail)
+
+    assert breaker.state == "open"
+    with pytest.raises(CircuitBreakerError):
+        breaker.call(lambda: "not called")
+
+
+def test_success_resets_failure_count():
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30, name="test")
+
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    breaker.call(lambda: None)
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    assert breaker.state == "closed"
+
+
+def test_result_check_counts_server_errors():
+    breaker = CircuitBreaker(fail_max=2, reset_timeout=30, name="test",
+                             is_failure=lambda response: response.status_code >= 500)
+
+    assert breaker.call(FakeResponse, 503).status_code == 503
+    assert breaker.call(FakeResponse, 500).status_code == 500
+
+    assert breaker.state == "open"
+
+
+def test_trial_call_after_reset_timeout():
+    breaker = CircuitBreaker(fail_max=1, reset_timeout=0.05, name="test")
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    with pytest.raises(ConnectionError):
+        breaker.call(fail)
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.state == "closed"
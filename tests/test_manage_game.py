@@ -0,0 +1,166 @@
+import threading
+import time
+
+import orjson
+import pytest
+
+import composite_services.manage_game.app as manage_game
+
+PLAYER = {"player_id": 1, "name": "Hero", "max_health": 100, "current_health": 40, "room_id": 2, "sum_score": 30}
+RESET_PLAYER = dict(PLAYER, current_health=100, room_id=0, sum_score=0)
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.content = orjson.dumps(body if body is not None else {})
+        self.text = self.content.decode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise manage_game.requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """
+    Stands in for the module-level SESSION. Responses come from `statuses`
+    (keyed by (method, path prefix)) so tests can make one service fail.
+    """
+
+    def __init__(self, player=PLAYER, delay=0):
+        self.player = player
+        self.delay = delay
+        self.statuses = {}
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _respond(self, method, url, **kwargs):
+        path = url.split("//", 1)[-1].split("/", 1)[-1]
+        with self._lock:
+            self.calls.append((method, "/" + path))
+        if self.delay:
+            time.sleep(self.delay)
+
+        for (status_method, prefix), status in self.statuses.items():
+            if status_method == method and ("/" + path).startswith(prefix):
+                return FakeResponse(status, {"error": "failed"})
+
+        if method == "get" and path.startswith("player/"):
+            return FakeResponse(200, self.player)
+        if method == "put" and path.startswith("player/"):
+            return FakeResponse(200, {"message": "Player updated successfully", "player": RESET_PLAYER})
+        return FakeResponse(200, {})
+
+    def count(self, method, prefix):
+        return sum(1 for call in self.calls if call[0] == method and call[1].startswith(prefix))
+
+    def __getattr__(self, method):
+        return lambda url, **kwargs: self._respond(method, url, **kwargs)
+
+
+@pytest.fixture
+def session(monkeypatch):
+    fake = FakeSession()
+    monkeypatch.setattr(manage_game, "SESSION", fake)
+    monkeypatch.setattr(manage_game, "log_activity", lambda *args, **kwargs: True)
+    for name in ("PLAYER", "INVENTORY", "ROOM", "PLAYER_ROOM_INTERACTION", "ENEMY"):
+        monkeypatch.setattr(manage_game, f"{name}_BREAKER", manage_game._service_breaker(name.lower()))
+    manage_game._player_cache.clear()
+    manage_game._reset_response_cache.clear()
+    manage_game._reset_in_flight.clear()
+    return fake
+
+
+@pytest.fixture
+def client(session):
+    manage_game.app.config["TESTING"] = True
+    return manage_game.app.test_client()
+
+
+def test_repeated_full_reset_is_served_from_cache(client, session):
+    first = client.post("/game/full-reset/1")
+    calls_after_first = len(session.calls)
+    second = client.post("/game/full-reset/1")
+
+    assert first.status_code == 200
+    assert first.headers["X-Cache"] == "MISS"
+    assert second.status_code == 200
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.get_json() == first.get_json()
+    assert len(session.calls) == calls_after_first
+
+
+def test_partial_reset_is_not_cached(client, session):
+    session.statuses[("delete", "/inventory/")] = 500
+    first = client.post("/game/full-reset/1")
+
+    del session.statuses[("delete", "/inventory/")]
+    retry = client.post("/game/full-reset/1")
+
+    assert first.status_code == 207
+    assert retry.status_code == 200
+    assert retry.headers["X-Cache"] == "MISS"
+    assert session.count("delete", "/inventory/") == 2
+
+
+def test_concurrent_duplicate_full_resets_run_once(client, session):
+    session.delay = 0.1
+    responses = []
+
+    def post():
+        responses.append(manage_game.app.test_client().post("/game/full-reset/1"))
+
+    threads = [threading.Thread(target=post) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [response.status_code for response in responses] == [200, 200]
+    assert sorted(response.headers["X-Cache"] for response in responses) == ["HIT", "MISS"]
+    assert session.count("put", "/player/") == 1
+    assert session.count("delete", "/inventory/") == 1
+
+
+def test_player_service_error_is_not_cached_as_not_found(client, session):
+    session.statuses[("get", "/player/")] = 500
+    first = client.post("/game/full-reset/1")
+    second = client.post("/game/full-reset/1")
+
+    assert first.status_code == 503
+    assert second.status_code == 503
+    assert session.count("get", "/player/") == 2
+
+
+def test_full_reset_after_reset_uses_refreshed_player_cache(client, session):
+    client.post("/game/reset/1")
+    player_lookups = session.count("get", "/player/")
+
+    response = client.post("/game/full-reset/1")
+
+    assert response.status_code == 200
+    assert session.count("get", "/player/") == player_lookups
+    assert manage_game._player_cache[1] == RESET_PLAYER
+
+
+def test_reset_of_already_reset_player_is_a_no_op(client, session):
+    session.player = RESET_PLAYER
+
+    response = client.post("/game/reset/1")
+
+    assert response.status_code == 200
+    assert response.get_json()["no_op"] is True
+    assert session.count("put", "/player/") == 0
+    assert session.count("get", "/reset") == 0
+
+
+def test_reset_with_open_player_breaker_returns_json_503(client, session, monkeypatch):
+    breaker = manage_game.CircuitBreaker(fail_max=1, reset_timeout=30, name="player_service")
+    with pytest.raises(ConnectionError):
+        breaker.call(lambda: (_ for _ in ()).throw(ConnectionError("down")))
+    monkeypatch.setattr(manage_game, "PLAYER_BREAKER", breaker)
+
+    response = client.post("/game/reset/1")
+
+    assert response.status_code == 503
+    assert "error" in response.get_json()
@@ -0,0 +1,71 @@
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOM_SERVICE_DIR = os.path.join(os.path.dirname(__file__), "..", "atomic_services", "room")
+
+
+@pytest.fixture
+def client():
+    # The room service imports its models as a top-level module and reads the
+    # database URL at import time, so load it fresh against in-memory SQLite
+    os.environ["DATABASE_URL"] = "sqlite:///:memory:"
+    sys.path.insert(0, ROOM_SERVICE_DIR)
+    for name in ("app", "models"):
+        sys.modules.pop(name, None)
+    try:
+        room_app = importlib.import_module("app")
+    finally:
+        sys.path.remove(ROOM_SERVICE_DIR)
+
+    app = room_app.app
+    app.config["TESTING"] = True
+    with app.app_context():
+        room_app.db.session.add(room_app.Room(Description="Entrance", ItemIDs=[], EnemyIDs=[]))
+        room_app.db.session.add(room_app.Room(Description="Hall", ItemIDs=[9], EnemyIDs=[9], DoorLocked=True))
+        room_app.db.session.commit()
+
+    with app.test_client() as test_client:
+        yield test_client
+
+    for name in ("app", "models"):
+        sys.modules.pop(name, None)
+
+
+def test_bulk_update_applies_every_room(client):
+    response = client.put("/rooms/bulk", json={"rooms": [
+        {"room_id": 1, "item_ids": [1, 2], "enemy_ids": [], "door_locked": False},
+        {"room_id": 2, "item_ids": [3], "enemy_ids": [1], "door_locked": False},
+    ]})
+
+    assert response.status_code == 200
+    assert [room["room_id"] for room in response.get_json()["rooms"]] == [1, 2]
+    assert client.get("/room/1").get_json()["item_ids"] == [1, 2]
+    room_2 = client.get("/room/2").get_json()
+    assert room_2["item_ids"] == [3]
+    assert room_2["enemy_ids"] == [1]
+    assert room_2["door_locked"] is False
+
+
+def test_bulk_update_requires_room_id(client):
+    response = client.put("/rooms/bulk", json={"rooms": [{"item_ids": [1]}]})
+
+    assert response.status_code == 400
+
+
+def test_bulk_update_rejects_non_object_bodies(client):
+    assert client.put("/rooms/bulk", json=[{"room_id": 1}]).status_code == 400
+    assert client.put("/rooms/bulk", json={"rooms": [1, 2]}).status_code == 400
+
+
+def test_bulk_update_unknown_room_changes_nothing(client):
+    response = client.put("/rooms/bulk", json={"rooms": [
+        {"room_id": 1, "item_ids": [7]},
+        {"room_id": 99, "item_ids": [8]},
+    ]})
+
+    assert response.status_code == 404
+    assert response.get_json()["missing_room_ids"] == [99]
+    assert client.get("/room/1").get_json()["item_ids"] == []